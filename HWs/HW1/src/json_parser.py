@@ -1,9 +1,62 @@
 import os
-import glob
 import errno
 import json
+import mmap
+import logging
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
+
+# Prefer orjson when it is installed - it is a lot faster than the stdlib parser
+# on big trees. orjson is strict RFC 8259 though: it rejects NaN/Infinity/-Infinity,
+# which the stdlib accepts (and +-Infinity is a natural leaf value). On a decode
+# error we retry with the stdlib, so the same files parse with either backend and
+# truly malformed input still raises json.JSONDecodeError.
+# Known difference: some orjson versions (e.g. 3.8.x) read integers wider than
+# 64 bits as floats instead of failing, so those lose precision.
+try:
+    import orjson
+
+    def _loads(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+    def _loads_buffer(buf):
+        try:
+            return orjson.loads(buf) # reads memoryviews (e.g. over an mmap) without copying
+        except orjson.JSONDecodeError:
+            return json.loads(bytes(buf))
+except ImportError:
+    _loads = json.loads
+    _loads_buffer = lambda buf: json.loads(bytes(buf))
+
+# Files at least this big are memory-mapped instead of read into a bytes object
+_MMAP_MIN_SIZE = 1 << 20 # 1 MiB
+
+# Parser progress messages are debug logs (off by default) - printing one line
+# per node was the slowest part of parsing big trees
+logger = logging.getLogger(__name__)
+
+class NodeType(IntEnum):
+    """
+    Integer tag for the node types - cheaper to compare than strings in hot loops.
+    """
+    LEAF = 0
+    MAX = 1
+    MIN = 2
+
+# Module-level aliases, so hot loops do a global lookup instead of an enum attribute lookup
+LEAF, MAX, MIN = NodeType.LEAF, NodeType.MAX, NodeType.MIN
+_TYPE_TAGS = {"leaf": LEAF, "max": MAX, "min": MIN}
+
+# list_leaves runs a full cycle check once it has expanded this many nodes
+_CYCLE_CHECK_AFTER = 1 << 16
 
 class Node:
+    # Fixed attribute set - no per-instance __dict__, which adds up on big trees
+    __slots__ = ("name", "_type", "type_tag", "children", "value", "parent")
+
     def __init__(self, name, type, children=None, value=None, parent=None):
         """
         Initialize a tree node.
@@ -15,18 +68,37 @@ class Node:
         :param parent: Parent Node object (default: None)
         """
         self.name = name
-        self.type = type
+        self.type = type # also sets type_tag
         self.children = children if children is not None else []
         self.value = value
         self.parent = parent
 
+    @property
+    def type(self):
+        """
+        Node type string ('leaf', 'max', or 'min').
+        
+        :return: The node type
+        """
+        return self._type
+
+    @type.setter
+    def type(self, type):
+        """
+        Set the node type and keep type_tag in sync with it.
+        
+        :param type: New node type ('leaf', 'max', or 'min')
+        """
+        self._type = type
+        self.type_tag = _TYPE_TAGS.get(type) # NodeType member, None for unknown types
+
     def is_leaf(self):
         """
         Check if the node is a leaf node.
         
         :return: True if node is a leaf, False otherwise
         """
-        return self.type == "leaf"
+        return self.type_tag == LEAF
 
     def __repr__(self):  # concise repr for prints
         """
@@ -41,20 +113,28 @@ class Node:
 
 def list_leaves(root):
     """
-    Recursively traverse the tree and return all leaf nodes.
+    Traverse the tree (iterative DFS) and return all leaf nodes.
     
     :param root: Root node of the tree
-    :return: List of all leaf nodes found in the tree
+    :return: List of all leaf nodes found in the tree, in DFS order
+    :raises JSONTreeParserError: If the node graph contains a cycle
     """
     leaves = []
-
-    def dfs(n):
-        if n.is_leaf():
-            leaves.append(n)
-        for c in n.children:
-            dfs(c)
-
-    dfs(root)
+    stack = [root]
+    pop, append, extend = stack.pop, leaves.append, stack.extend
+    expanded = 0
+    while stack:
+        n = pop()
+        if n.type_tag == LEAF:
+            append(n)
+        children = n.children
+        if children: # most nodes are leaves with no children - skip the extend
+            expanded += 1
+            if expanded == _CYCLE_CHECK_AFTER:
+                # A graph this big might be cyclic, which would loop forever - check once
+                _raise_if_cyclic((root,))
+            # Reversed so the leftmost child is popped first (keeps DFS order)
+            extend(children[::-1])
     return leaves
 
 class JSONTreeParserError(Exception):
@@ -70,6 +150,35 @@ def raise_no_json_files_found(start_directory):
     error_message = f"No JSON files found in directory: {start_directory}"
     raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), error_message)
 
+def _iter_json_files(directory):
+    """
+    Yield paths of JSON files under a directory (and all subdirectories).
+
+    Uses os.scandir with an explicit stack of directories, so deep folder
+    trees need no recursion. DirEntry.is_dir()/is_file() reuse the file type
+    returned by readdir, so no extra stat() is needed per entry. Hidden
+    entries (starting with '.') are skipped, same as glob's '**' / '*' did.
+    Like glob, directories that can't be listed (missing, unreadable, not a
+    directory) are skipped instead of raising.
+    
+    :param directory: Directory to scan
+    :return: Generator of paths to JSON files
+    """
+    pending = [directory]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+
 def find_json_files(start_directory):
     """
     Find all JSON files recursively in a directory.
@@ -78,15 +187,56 @@ def find_json_files(start_directory):
     :return: List of absolute paths to all JSON files found
     :raises FileNotFoundError: If no JSON files are found in the directory tree
     """
-    full_pattern = os.path.join(start_directory, "**", "*.json")
-
-    found_files = [f for f in glob.glob(full_pattern, recursive=True) if os.path.isfile(f)] 
+    found_files = list(_iter_json_files(start_directory))
     
     if not found_files:
         raise_no_json_files_found(start_directory)
     
     return found_files
 
+def _raise_if_cyclic(nodes):
+    """
+    Raise JSONTreeParserError if the linked nodes contain a cycle.
+
+    Iterative DFS; every node is either unvisited, on the current DFS path, or
+    done. Reaching a node that is still on the path means a cycle. Shared
+    subtrees (a node with several parents) are fine.
+    
+    :param nodes: Iterable of all linked nodes
+    :raises JSONTreeParserError: If some node is its own descendant
+    """
+    on_path, done = 1, 2
+    state = {} # id(node) -> on_path / done
+    for start in nodes:
+        if start.type_tag == LEAF or id(start) in state:
+            continue
+        state[id(start)] = on_path
+        stack = [(start, iter(start.children))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child.type_tag == LEAF:
+                    continue
+                child_state = state.get(id(child))
+                if child_state is None:
+                    state[id(child)] = on_path
+                    stack.append((child, iter(child.children)))
+                    break
+                if child_state == on_path:
+                    raise JSONTreeParserError(f"Cycle detected: node '{child.name}' is its own descendant.")
+            else:
+                state[id(node)] = done
+                stack.pop()
+
+def _is_sequence(value):
+    """
+    Check whether a value can be used as a 'children' array.
+    
+    :param value: Value of a node's 'children' entry
+    :return: True for any Sequence except str/bytes, False otherwise
+    """
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray))
+
 def parse_tree_from_dict(data):
     """
     Parse a dictionary (loaded JSON) describing a tree and return the root Node.
@@ -104,12 +254,15 @@ def parse_tree_from_dict(data):
     }
 
     This function builds the Node graph, validates structure and constraints.
+    Any read-only Mapping works in place of a dict (e.g. a lazy proxy from a
+    streaming JSON parser), and any non-string Sequence in place of the
+    'children' list; only 'type', 'value' and 'children' are ever read.
     
-    :param data: Dictionary parsed from JSON containing tree structure
+    :param data: Dictionary (or Mapping) parsed from JSON containing tree structure
     :return: Root node of the constructed tree
     :raises JSONTreeParserError: If data format is invalid or constraints are violated
     """
-    if not isinstance(data, dict):
+    if not isinstance(data, Mapping):
         raise JSONTreeParserError("Input data must be a dictionary (parsed JSON).")
 
     if "root" not in data or "nodes" not in data:
@@ -118,14 +271,20 @@ def parse_tree_from_dict(data):
     root_name = data["root"]
     nodes_def = data["nodes"]
 
-    if not isinstance(nodes_def, dict):
+    if not isinstance(nodes_def, Mapping):
         raise JSONTreeParserError("'nodes' must be a dictionary mapping names to node specs.")
 
-    # First pass: create Node objects without linking children
+    # Single pass: create Node objects and validate their specs. Children are
+    # linked afterwards from the pending list, once every name is defined.
     nodes = {}
-    print("[parser] Creating node objects...")
+    pending = [] # (node, child_names) for every max/min node
+    referenced = set() # every child name used by some node
+    # Checked once per parse so the per-node loops skip the logger call entirely
+    debug = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("[parser] Creating node objects...")
     for name, spec in nodes_def.items():
-        if not isinstance(spec, dict) or "type" not in spec:
+        # Plain dicts (what json.loads returns) skip the much slower ABC check
+        if (type(spec) is not dict and not isinstance(spec, Mapping)) or "type" not in spec:
             raise JSONTreeParserError(f"Node spec for '{name}' must be a dict with a 'type'.")
         ntype = spec["type"]
         if ntype == "leaf":
@@ -135,58 +294,87 @@ def parse_tree_from_dict(data):
             if "children" in spec:
                 raise JSONTreeParserError(f"Leaf node '{name}' must not have 'children' specified.")
             node = Node(name=name, type="leaf", value=spec["value"])
-        else:
-            # max/min expected to have children
+        elif ntype in ("max", "min"):
+            # max/min must have a non-empty list of children
             if "children" not in spec:
                 raise JSONTreeParserError(f"Non-leaf node '{name}' missing 'children'.")
+            child_names = spec["children"]
+            if type(child_names) is not list and not _is_sequence(child_names):
+                raise JSONTreeParserError(f"'children' for node '{name}' must be a list.")
+            if not child_names:
+                raise JSONTreeParserError(f"Node '{name}' of type '{ntype}' must have children.")
             node = Node(name=name, type=ntype)
+            pending.append((node, child_names))
+            referenced.update(child_names)
+        else:
+            raise JSONTreeParserError(f"Node '{name}' has unknown type '{ntype}' (expected leaf, max or min).")
         nodes[name] = node
-        print(f"  created: {node}")
+        if debug:
+            logger.debug("  created: %r", node)
 
-    # Second pass: link children
-    print("[parser] Linking children references...")
-    for name, spec in nodes_def.items():
-        node = nodes[name]
-        if node.is_leaf():
-            continue
-        child_names = spec.get("children", [])
-        if not isinstance(child_names, list):
-            raise JSONTreeParserError(f"'children' for node '{name}' must be a list.")
+    # Check all child references at once instead of per edge
+    missing = referenced - nodes.keys()
+    if missing:
+        raise JSONTreeParserError(f"Children referenced but not defined in nodes: {sorted(missing, key=str)}")
+
+    # Link children references
+    logger.debug("[parser] Linking children references...")
+    for node, child_names in pending:
         for cname in child_names:
-            if cname not in nodes:
-                raise JSONTreeParserError(f"Child '{cname}' referenced by '{name}' not defined in nodes.")
             child_node = nodes[cname]
             node.children.append(child_node)
             if child_node.parent is None:
                 child_node.parent = node
-        print(f"  linked {name} -> {[c.name for c in node.children]}")
+        if debug:
+            logger.debug("  linked %s -> %s", node.name, [c.name for c in node.children])
+
+    # Traversals are iterative, so a cycle would loop forever instead of failing
+    _raise_if_cyclic(nodes.values())
 
     if root_name not in nodes:
         raise JSONTreeParserError(f"Root '{root_name}' not found among nodes.")
 
     root = nodes[root_name]
 
-    # Basic validation: ensure leaf nodes have no children and non-leaf nodes have children
-    print("[parser] Validating node constraints...")
-    for n in nodes.values():
-        if n.is_leaf() and n.children:
-            raise JSONTreeParserError(f"Leaf node '{n.name}' has children defined.")
-        if n.type in ("max", "min") and not n.children:
-            raise JSONTreeParserError(f"Node '{n.name}' of type '{n.type}' must have children.")
-
-    print(f"[parser] Parsed tree root: {root.name}, total nodes: {len(nodes)}")
+    logger.debug("[parser] Parsed tree root: %s, total nodes: %d", root.name, len(nodes))
     return root
 
 
 def parse_tree_from_json_string(json_text):
     """
     Parse a JSON string describing a tree and return the root Node.
+
+    Bytes are accepted as well, so file contents can be passed in without
+    decoding them to str first.
     
-    :param json_text: JSON string containing tree structure
+    :param json_text: JSON string (str or UTF-8 bytes) containing tree structure
     :return: Root node of the constructed tree
     :raises JSONTreeParserError: If JSON format is invalid or tree constraints are violated
     :raises json.JSONDecodeError: If JSON text is malformed
     """
-    data = json.loads(json_text)
+    data = _loads(json_text)
     return parse_tree_from_dict(data)
 
+
+def parse_tree_from_json_file(path):
+    """
+    Read a JSON tree file and return the root Node.
+
+    Small files are read in one call. Files of _MMAP_MIN_SIZE bytes or more are
+    memory-mapped, so the parser reads straight from the page cache instead of
+    from a full in-memory copy of the file.
+    
+    :param path: Path to the JSON tree file
+    :return: Root node of the constructed tree
+    :raises FileNotFoundError: If the file does not exist
+    :raises JSONTreeParserError: If tree constraints are violated
+    :raises json.JSONDecodeError: If the file content is malformed JSON
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_MIN_SIZE:
+            data = _loads(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                data = _loads_buffer(view)
+    return parse_tree_from_dict(data)
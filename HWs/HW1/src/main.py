@@ -31,21 +31,18 @@ def run_miniMax(path):
     :raises Exception: For other unexpected errors during processing
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-                json_string = f.read()
-            
-                root = jp.parse_tree_from_json_string(json_string)
-                # After the line above, we have the Root object on which we can run DFS\MiniMax
+        root = jp.parse_tree_from_json_file(path)
+        # After the line above, we have the Root object on which we can run DFS\MiniMax
 
-                # Print before miniMax
-                print(f"\nOriginal tree (before miniMax):")
-                utils.pretty_print(root)
+        # Print before miniMax
+        print(f"\nOriginal tree (before miniMax):")
+        utils.pretty_print(root)
 
-                mini_max.miniMax(root)
-                # Print after miniMax
-                print(f"\nTree after miniMax:")
-                utils.pretty_print(root)
-                print(f"Game value in root: ({root.name}): {root.value:.1f}")
+        mini_max.miniMax(root)
+        # Print after miniMax
+        print(f"\nTree after miniMax:")
+        utils.pretty_print(root)
+        print(f"Game value in root: ({root.name}): {root.value:.1f}")
 
     except FileNotFoundError:
         print(f"Error: File not found at {path}")
@@ -85,8 +82,8 @@ def main(args):
                 return
 
             # Create the exact valid path to the JSON file
-            path = utils.create_absolute_path(path)
-            if (utils.is_path_valid(path)):
+            path, valid = utils.canonicalize_and_check(path)
+            if (valid):
                 print("Found valid path, running MiniMax")
                 
                 run_miniMax(path)
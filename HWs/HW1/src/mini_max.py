@@ -1,26 +1,155 @@
+import math
+from operator import attrgetter
+
 import json_parser as jp
 
+LEAF, MAX, MIN = jp.LEAF, jp.MAX, jp.MIN
+_value = attrgetter("value") # C-level getter, cheaper than a generator in max()/min()
+_CYCLE_CHECK_DEPTH = 1024 # path length at which the searches first check for a cycle
+
 
 def miniMax(node : jp.Node):
     """
     Run miniMax algorithm on a given node.
     The algorithm changes the node`s value in place
 
+    The tree is walked iteratively (explicit stack, post-order), so deep trees
+    don't hit Python's recursion limit.
+
     @param node: Root node to run miniMax on
+    @return: The game value of the given node
+    """
+
+    # Leaf → nothing to evaluate
+    if node.type_tag == LEAF:
+        return node.value
+
+    # Each internal node is pushed twice: first on its own to be expanded, then
+    # again under a None marker, so it is evaluated once all children have values.
+    stack = [node]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    depth = 0 # nodes expanded but not evaluated yet, i.e. the current path
+    check_depth = _CYCLE_CHECK_DEPTH
+    while stack:
+        n = pop()
+        if n is not None:
+            depth += 1
+            if depth == check_depth:
+                # The nodes right below the None markers are the current path
+                _raise_if_path_repeats([stack[i - 1] for i, x in enumerate(stack) if x is None] + [n])
+                check_depth *= 2
+            push(n)
+            push(None)
+            # Leaves already hold their value, no need to visit them
+            extend([c for c in n.children if c.type_tag != LEAF])
+            continue
+
+        depth -= 1
+        n = pop()
+        tag = n.type_tag
+        if tag == MAX:
+            n.value = max(map(_value, n.children))
+        elif tag == MIN:
+            n.value = min(map(_value, n.children))
+        else:
+            raise ValueError("Unknown node type:", n.type)
+
+    return node.value
+
+
+def alphaBeta(node : jp.Node):
+    """
+    Run miniMax with alpha-beta pruning on a given node.
+
+    Gives the same game value as miniMax, but stops evaluating a node's
+    children as soon as they can no longer change the result (alpha >= beta),
+    so pruned subtrees are never visited. Like miniMax it is iterative and
+    stores values in place - but only the root value is guaranteed exact:
+    nodes that were cut off store a bound, and pruned nodes keep their old value.
+
+    @param node: Root node to run alpha-beta on
+    @return: The game value of the given node
     """
 
-    # Leaf → return value without recursion
-    if node.type == "leaf":
+    # Leaf → nothing to evaluate
+    if node.type_tag == LEAF:
         return node.value
 
-    # Recursively evaluate children
-    values = [miniMax(child) for child in node.children]
+    # Frame: [node, alpha, beta, best value so far, index of next child]
+    stack = [_alpha_beta_frame(node, -math.inf, math.inf)]
+    check_depth = _CYCLE_CHECK_DEPTH
+    while True:
+        frame = stack[-1]
+        n, alpha, beta, best, i = frame
+        children = n.children
+
+        if i < len(children) and alpha < beta:
+            child = children[i]
+            frame[4] = i + 1
+            if child.type_tag != LEAF:
+                if len(stack) == check_depth:
+                    # The open frames are exactly the current path
+                    _raise_if_path_repeats([f[0] for f in stack] + [child])
+                    check_depth *= 2
+                stack.append(_alpha_beta_frame(child, alpha, beta))
+                continue
+            value = child.value
+        else:
+            # All children seen (or the rest pruned) → node is done
+            n.value = best
+            stack.pop()
+            if not stack:
+                return best
+            frame = stack[-1]
+            value = best
+
+        # Fold the finished child's value into the frame on top of the stack
+        if frame[0].type_tag == MAX:
+            if value > frame[3]:
+                frame[3] = value
+            if value > frame[1]:
+                frame[1] = value
+        else:
+            if value < frame[3]:
+                frame[3] = value
+            if value < frame[2]:
+                frame[2] = value
+
 
-    if node.type == "max":
-        node.value = max(values)
-        return max(values)
-    elif node.type == "min":
-        node.value = min(values)
-        return min(values)
+def _alpha_beta_frame(node, alpha, beta):
+    """
+    Create the stack frame alphaBeta uses for an internal node.
+
+    @param node: Internal (max/min) node
+    @param alpha: Best value the max player can already guarantee
+    @param beta: Best value the min player can already guarantee
+    @return: Frame list [node, alpha, beta, best, next_child_index]
+    """
+    if node.type_tag == MAX:
+        best = -math.inf
+    elif node.type_tag == MIN:
+        best = math.inf
     else:
         raise ValueError("Unknown node type:", node.type)
+    if not node.children:
+        raise ValueError("Node has no children:", node.name)
+    return [node, alpha, beta, best, 0]
+
+
+def _raise_if_path_repeats(path):
+    """
+    Raise ValueError if some node appears twice on a root-to-node path.
+
+    The searches call this only each time the path gets twice as long as at
+    the last check (starting at _CYCLE_CHECK_DEPTH). In a tree the path can't
+    grow past the number of distinct nodes, but in a cycle it grows forever -
+    so a cycle is always caught, while normal trees pay only an int compare
+    per node.
+
+    @param path: Nodes on the current path, root first
+    """
+    seen = set()
+    for n in path:
+        if id(n) in seen:
+            raise ValueError("Cycle detected at node:", n.name)
+        seen.add(id(n))
@@ -1,22 +1,105 @@
 import os
+import sys
+import time
+from itertools import repeat
+
+import json_parser as jp
+
+# Directory of this module (src) and the project root above it - fixed for the
+# whole run, so computed once at import instead of on every path lookup
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+_SEARCH_ROOTS = (_SCRIPT_DIR, _PROJECT_ROOT) # where relative paths are looked up, in order
+
+# On POSIX an absolute path is simply one starting with '/' (see create_absolute_path)
+_IS_POSIX = os.name == "posix"
+
+# is_path_valid cache: path -> (time.monotonic() of the check, exists).
+# Short TTL keeps it in step with the filesystem, size cap keeps it small.
+_EXIST_CACHE = {}
+_EXIST_TTL = 1.0 # seconds
+_EXIST_CACHE_MAX = 256
+
+_EXIT_COMMANDS = frozenset(("exit", "quit"))
+
+def _collect_lines(root, indent, lines):
+    """
+    Append the formatted lines of a tree to a list (iterative DFS, no recursion).
+    
+    :param root: Root node of the tree
+    :param indent: Indentation level of the root
+    :param lines: List the lines are appended to
+    """
+    # prefixes[d] == "  " * d - grown on demand so each indent string is built
+    # once per call (kept local, so deep trees don't pin memory after printing)
+    prefixes = [""]
+    append = lines.append
+    stack = [(root, indent)]
+    while stack:
+        node, depth = stack.pop()
+        while depth >= len(prefixes):
+            prefixes.append(prefixes[-1] + "  ")
+        prefix = prefixes[depth]
+        # Read each attribute once per node; checking the type tag inline
+        # (same check Node.is_leaf does) saves a method call per node
+        name, value = node.name, node.value
+        if node.type_tag == jp.LEAF:
+            append(f"{prefix}- {name} (leaf) value={value:.1f}")
+            continue
+        node_type = node.type
+        if value is None:
+            append(f"{prefix}- {name} ({node_type})")
+        else:
+            append(f"{prefix}- {name} ({node_type}) value={value:.1f}")
+        # Reversed so the leftmost child is popped (and printed) first
+        stack.extend(zip(reversed(node.children), repeat(depth + 1)))
+
+def pretty_print_stream(root, file=None, indent=0):
+    """
+    Write a tree structure, formatted and indented, to a text stream.
+
+    All lines are built first and written with a single file.write call.
+    
+    :param root: Root node of the tree to print
+    :param file: Text stream to write to (default: sys.stdout at call time)
+    :param indent: Current indentation level (default: 0)
+    """
+    if file is None:
+        file = sys.stdout
+    lines = []
+    _collect_lines(root, indent, lines)
+    file.write("\n".join(lines) + "\n")
 
 def pretty_print(root, indent=0):
     """
-    Recursively print a tree structure in a formatted, indented manner.
+    Print a tree structure in a formatted, indented manner.
+
+    The tree is walked iteratively (no recursion limit on deep trees) and the
+    output is written with a single sys.stdout.write call.
     
     :param root: Root node of the tree to print
     :param indent: Current indentation level (default: 0)
     """
-    prefix = "  " * indent
-    if root.is_leaf():
-        print(f"{prefix}- {root.name} (leaf) value={root.value:.1f}")
-    else:
-        if root.value == None:
-            print(f"{prefix}- {root.name} ({root.type})")
-        else:
-            print(f"{prefix}- {root.name} ({root.type}) value={root.value:.1f}")
-        for c in root.children:
-            pretty_print(c, indent + 1)
+    pretty_print_stream(root, sys.stdout, indent)
+
+def pretty_print_many(roots, file=None):
+    """
+    Write several trees, one after another, to a text stream.
+
+    Same output as calling pretty_print_stream on each root in turn, but the
+    lines of all trees go into one buffer and are written with a single
+    file.write call. Nothing is written if roots is empty.
+    
+    :param roots: Iterable of root nodes to print
+    :param file: Text stream to write to (default: sys.stdout at call time)
+    """
+    if file is None:
+        file = sys.stdout
+    lines = []
+    for root in roots:
+        _collect_lines(root, 0, lines)
+    if lines:
+        file.write("\n".join(lines) + "\n")
 
 def resolve_path_relative_to_python_script(path):
     """
@@ -25,30 +108,34 @@ def resolve_path_relative_to_python_script(path):
     :param path: Relative path to resolve
     :return: Absolute path combining script directory and provided path
     """
-    # Find the path to the directory that contains the file (this module)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
     # If empty path, return the script directory
     if not path:
-        return script_dir
+        return _SCRIPT_DIR
 
     # If an absolute path was provided, return it unchanged
     if os.path.isabs(path):
         return path
 
-    # Candidate 1: file relative to the script (src) directory
-    candidate_src = os.path.join(script_dir, path)
-    if os.path.exists(candidate_src):
-        return os.path.abspath(candidate_src)
-
-    # Candidate 2: file in the project root (parent of src)
-    project_root = os.path.dirname(script_dir)
-    candidate_root = os.path.join(project_root, path)
-    if os.path.exists(candidate_root):
-        return os.path.abspath(candidate_root)
+    found = _find_existing_candidate(path)
+    if found is not None:
+        return found
 
     # Fallback: return argument as is so it fails on is_path_valid() in main
     return path
+
+def _find_existing_candidate(path):
+    """
+    Look a relative path up under the script (src) directory, then the project root.
+    
+    :param path: Relative path to look up
+    :return: Normalised absolute path of the first candidate that exists, or None
+    """
+    # Joining onto an absolute dir is already absolute, only normalisation is needed
+    for base in _SEARCH_ROOTS:
+        candidate = os.path.join(base, path)
+        if os.path.exists(candidate):
+            return os.path.normpath(candidate)
+    return None
             
 def create_absolute_path(path):
     """
@@ -63,6 +150,10 @@ def create_absolute_path(path):
     if path is None:
         return None
 
+    # Fast path: on POSIX a str starting with '/' is already absolute
+    if _IS_POSIX and isinstance(path, str) and path.startswith("/"):
+        return path
+
     if not os.path.isabs(path):
         # Resolve using the helper which tries src/ then project root
         resolved_path = resolve_path_relative_to_python_script(path)
@@ -74,12 +165,48 @@ def create_absolute_path(path):
 def is_path_valid(path):
     """
     Check if the given path exists.
+
+    Results are cached for _EXIST_TTL seconds, so the same path typed again in
+    the main loop doesn't hit the filesystem every time. Call
+    is_path_valid.cache_clear() after creating/removing files to see the change
+    immediately.
     
     :param path: Path to validate
     :return: True if path exists, False otherwise
     """
+    now = time.monotonic()
+    cached = _EXIST_CACHE.get(path)
+    if cached is not None and now - cached[0] < _EXIST_TTL:
+        return cached[1]
+
+    result = os.path.exists(path)
+    if len(_EXIST_CACHE) >= _EXIST_CACHE_MAX:
+        _EXIST_CACHE.clear()
+    _EXIST_CACHE[path] = (now, result)
+    return result
+
+is_path_valid.cache_clear = _EXIST_CACHE.clear
+
+def canonicalize_and_check(path):
+    """
+    Resolve a user-given path and check that it exists, in one step.
+
+    Same result as create_absolute_path followed by is_path_valid, but a
+    relative path found under src/ or the project root is not checked again:
+    the lookup that found it already proved it exists.
     
-    return os.path.exists(path)
+    :param path: Path to resolve (relative or absolute)
+    :return: Tuple (resolved_path, valid)
+    """
+    if path and not os.path.isabs(path):
+        found = _find_existing_candidate(path)
+        if found is not None:
+            return found, True
+        # Not found under either root - kept as given, like create_absolute_path does
+        return path, is_path_valid(path)
+
+    resolved_path = create_absolute_path(path)
+    return resolved_path, is_path_valid(resolved_path)
 
 def is_exit_command(command):
     """
@@ -87,9 +214,14 @@ def is_exit_command(command):
     
     Recognized exit commands are 'exit' and 'quit' (case-insensitive).
     
-    :param command: User input command to check
+    :param command: User input command to check (None is not an exit command)
     :return: True if command is 'exit' or 'quit', False otherwise
     """
-    exit_commands = {"exit", "quit"}
-    
-    return (command.lower() in exit_commands)
+    # Exact match first - the common lowercase case needs no lower() copy
+    if command in _EXIT_COMMANDS:
+        return True
+    # Both commands have 4 chars and lower() never shortens a string, so any
+    # other length can't match - skip the lower() copy for it
+    if command is None or len(command) != 4:
+        return False
+    return command.lower() in _EXIT_COMMANDS
@@ -0,0 +1,42 @@
+"""
+Shared pytest configuration for the HW1 test suite.
+
+Puts the src directory on sys.path once per session so every test module can
+import the HW1 modules directly, regardless of the directory pytest runs from,
+and resets process-wide caches between tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Normalized absolute path, so the membership check matches however it was added
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+import json_parser as jp
+import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_path_cache():
+    """Start and end every test with an empty is_path_valid cache."""
+    utils.is_path_valid.cache_clear()
+    yield
+    utils.is_path_valid.cache_clear()
+
+
+@pytest.fixture
+def deep_chain():
+    """
+    Build a max/min chain deeper than the recursion limit, ending in one leaf.
+
+    :return: Tuple (root, depth) - depth internal nodes above the leaf "leaf" (value 1)
+    """
+    depth = sys.getrecursionlimit() + 100
+    node = jp.Node(name="leaf", type="leaf", value=1)
+    for i in range(depth):
+        node = jp.Node(name=f"N{i}", type="max" if i % 2 else "min", children=[node])
+    return node, depth
@@ -11,11 +11,10 @@ Tests cover:
 
 import pytest
 import json
+import math
 import os
-import tempfile
+from types import MappingProxyType
 
-import sys
-sys.path.insert(0, "../src")
 import json_parser as jp
 
 
@@ -72,6 +71,39 @@ class TestNode:
         node = jp.Node(name="A", type="min")
         assert node.is_leaf() is False
     
+    def test_node_type_tag(self):
+        """Test that the integer type tag matches the node type."""
+        assert jp.Node(name="A", type="leaf", value=1).type_tag == jp.LEAF
+        assert jp.Node(name="B", type="max").type_tag == jp.MAX
+        assert jp.Node(name="C", type="min").type_tag == jp.MIN
+        assert jp.Node(name="D", type="unknown").type_tag is None
+    
+    def test_node_type_tag_is_node_type(self):
+        """Test that the type tag is a NodeType member named after the type."""
+        tag = jp.Node(name="A", type="max").type_tag
+        assert isinstance(tag, jp.NodeType)
+        assert tag is jp.NodeType.MAX
+        assert tag.name.lower() == "max"
+    
+    def test_reassigning_type_updates_type_tag(self):
+        """Test that changing node.type keeps type_tag and is_leaf in sync."""
+        node = jp.Node(name="A", type="max")
+        node.type = "min"
+        assert node.type == "min"
+        assert node.type_tag == jp.MIN
+        node.type = "leaf"
+        assert node.type_tag == jp.LEAF
+        assert node.is_leaf() is True
+        node.type = "avg"
+        assert node.type_tag is None
+    
+    def test_node_has_no_instance_dict(self):
+        """Test that Node uses __slots__ and rejects ad-hoc attributes."""
+        node = jp.Node(name="A", type="leaf", value=1)
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+    
     def test_node_repr_leaf(self):
         """Test __repr__ for leaf node."""
         node = jp.Node(name="A", type="leaf", value=5)
@@ -148,6 +180,20 @@ class TestListLeaves:
         leaf_values = [l.value for l in leaves]
         assert leaf_values == [1, 2, 3]
     
+    def test_deep_tree_leaves(self, deep_chain):
+        """Test a chain deeper than the recursion limit."""
+        node, _ = deep_chain
+        leaves = jp.list_leaves(node)
+        assert [l.name for l in leaves] == ["leaf"]
+    
+    def test_cycle_raises(self):
+        """Test that a cyclic node graph raises instead of looping forever."""
+        a = jp.Node(name="A", type="max")
+        b = jp.Node(name="B", type="min", children=[a, jp.Node(name="C", type="leaf", value=1)])
+        a.children.append(b)
+        with pytest.raises(jp.JSONTreeParserError):
+            jp.list_leaves(a)
+    
     def test_no_leaves_error(self):
         """Test behavior when root has no leaves (edge case)."""
         root = jp.Node(name="A", type="max")
@@ -155,6 +201,41 @@ class TestListLeaves:
         assert leaves == []
 
 
+# Inputs that parse_tree_from_dict must reject with JSONTreeParserError
+INVALID_TREES = [
+    pytest.param({"nodes": {"A": {"type": "leaf", "value": 5}}}, id="missing_root_key"),
+    pytest.param({"root": "A"}, id="missing_nodes_key"),
+    pytest.param("not a dict", id="input_str"),
+    pytest.param([1, 2, 3], id="input_list"),
+    pytest.param({"root": "A", "nodes": ["A", "B", "C"]}, id="nodes_not_dict"),
+    pytest.param({"root": "A", "nodes": {"A": "invalid"}}, id="node_spec_not_dict"),
+    pytest.param({"root": "A", "nodes": {"A": {"children": ["B"]}}}, id="missing_type_in_node"),
+    pytest.param({"root": "A", "nodes": {
+        "A": {"type": "avg", "children": ["B"]},
+        "B": {"type": "leaf", "value": 1}
+    }}, id="unknown_node_type"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "leaf"}}}, id="leaf_missing_value"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max"}}}, id="non_leaf_missing_children"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max", "children": "B"}}}, id="children_not_list"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max", "children": b"B"}}}, id="children_bytes"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max", "children": ["B"]}}}, id="undefined_child_reference"),
+    pytest.param({"root": "A", "nodes": {"B": {"type": "leaf", "value": 5}}}, id="root_not_in_nodes"),
+    pytest.param({"root": "A", "nodes": {
+        "A": {"type": "leaf", "value": 5, "children": ["B"]},
+        "B": {"type": "leaf", "value": 3}
+    }}, id="leaf_with_children"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max", "children": []}}}, id="max_node_without_children"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "min", "children": []}}}, id="min_node_without_children"),
+    pytest.param({"root": "A", "nodes": {"A": {"type": "max", "children": ["A"]}}}, id="self_cycle"),
+    pytest.param({"root": "A", "nodes": {
+        "A": {"type": "max", "children": ["B"]},
+        "B": {"type": "min", "children": ["C", "D"]},
+        "C": {"type": "max", "children": ["A"]},
+        "D": {"type": "leaf", "value": 1}
+    }}, id="cycle_through_descendants"),
+]
+
+
 class TestParseTreeFromDict:
     """Test suite for parse_tree_from_dict function."""
     
@@ -193,152 +274,91 @@ class TestParseTreeFromDict:
         leaf_values = {l.value for l in leaves}
         assert leaf_values == {3, 5, -2}
     
-    def test_missing_root_key(self):
-        """Test error handling when 'root' key is missing."""
-        data = {
-            "nodes": {
-                "A": {"type": "leaf", "value": 5}
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_missing_nodes_key(self):
-        """Test error handling when 'nodes' key is missing."""
-        data = {
-            "root": "A"
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_input_not_dict(self):
-        """Test error handling when input is not a dictionary."""
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict("not a dict")
-        
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict([1, 2, 3])
-    
-    def test_nodes_not_dict(self):
-        """Test error handling when 'nodes' is not a dictionary."""
-        data = {
-            "root": "A",
-            "nodes": ["A", "B", "C"]
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_node_spec_not_dict(self):
-        """Test error handling when node spec is not a dictionary."""
-        data = {
-            "root": "A",
-            "nodes": {
-                "A": "invalid"
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_missing_type_in_node(self):
-        """Test error handling when node is missing 'type'."""
-        data = {
-            "root": "A",
-            "nodes": {
-                "A": {"children": ["B"]}
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_leaf_missing_value(self):
-        """Test error handling when leaf node is missing 'value'."""
-        data = {
+    def test_read_only_mapping_input(self):
+        """Test that any Mapping (not only dict) is accepted as input."""
+        data = MappingProxyType({
             "root": "A",
-            "nodes": {
-                "A": {"type": "leaf"}
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
-    
-    def test_non_leaf_missing_children(self):
-        """Test error handling when max/min node is missing 'children'."""
-        data = {
-            "root": "A",
-            "nodes": {
-                "A": {"type": "max"}
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
+            "nodes": MappingProxyType({
+                "A": MappingProxyType({"type": "max", "children": ["B"]}),
+                "B": MappingProxyType({"type": "leaf", "value": 4})
+            })
+        })
+        root = jp.parse_tree_from_dict(data)
+        assert root.name == "A"
+        assert root.children[0].value == 4
     
-    def test_children_not_list(self):
-        """Test error handling when 'children' is not a list."""
-        data = {
+    def test_children_may_be_any_sequence(self):
+        """Test that a non-list Sequence (e.g. a tuple from a proxy) works as 'children'."""
+        data = MappingProxyType({
             "root": "A",
-            "nodes": {
-                "A": {"type": "max", "children": "B"}
-            }
-        }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
+            "nodes": MappingProxyType({
+                "A": MappingProxyType({"type": "max", "children": ("B", "C")}),
+                "B": MappingProxyType({"type": "leaf", "value": 4}),
+                "C": MappingProxyType({"type": "leaf", "value": 2})
+            })
+        })
+        root = jp.parse_tree_from_dict(data)
+        assert [c.name for c in root.children] == ["B", "C"]
     
-    def test_undefined_child_reference(self):
-        """Test error handling when child is referenced but not defined."""
+    def test_parsing_is_silent_by_default(self, capsys):
+        """Test that parsing does not print per-node progress to stdout."""
         data = {
             "root": "A",
             "nodes": {
                 "A": {"type": "max", "children": ["B"]},
-                # B is not defined
+                "B": {"type": "leaf", "value": 1}
             }
         }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
+        jp.parse_tree_from_dict(data)
+        assert capsys.readouterr().out == ""
     
-    def test_root_not_in_nodes(self):
-        """Test error handling when root is not found in nodes."""
+    def test_progress_logged_at_debug_level(self, caplog):
+        """Test that parser progress is available through debug logging."""
         data = {
             "root": "A",
             "nodes": {
-                "B": {"type": "leaf", "value": 5}
+                "A": {"type": "max", "children": ["B"]},
+                "B": {"type": "leaf", "value": 1}
             }
         }
-        with pytest.raises(jp.JSONTreeParserError):
+        with caplog.at_level("DEBUG", logger=jp.__name__):
             jp.parse_tree_from_dict(data)
+        assert "created" in caplog.text
+        assert "linked A -> ['B']" in caplog.text
     
-    def test_leaf_with_children_error(self):
-        """Test error handling when leaf node has children."""
-        data = {
-            "root": "A",
-            "nodes": {
-                "A": {"type": "leaf", "value": 5, "children": ["B"]},
-                "B": {"type": "leaf", "value": 3}
-            }
-        }
+    @pytest.mark.parametrize("bad_data", INVALID_TREES)
+    def test_invalid_input_raises(self, bad_data):
+        """Test error handling for malformed input and violated tree constraints."""
         with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
+            jp.parse_tree_from_dict(bad_data)
     
-    def test_max_node_without_children_error(self):
-        """Test error handling when max node has no children."""
+    def test_all_undefined_children_reported(self):
+        """Test that the error lists every undefined child, not just the first."""
         data = {
             "root": "A",
             "nodes": {
-                "A": {"type": "max", "children": []}
+                "A": {"type": "max", "children": ["B", "X"]},
+                "B": {"type": "min", "children": ["Y"]},
             }
         }
-        with pytest.raises(jp.JSONTreeParserError):
+        with pytest.raises(jp.JSONTreeParserError) as exc_info:
             jp.parse_tree_from_dict(data)
+        assert "['X', 'Y']" in str(exc_info.value)
     
-    def test_min_node_without_children_error(self):
-        """Test error handling when min node has no children."""
+    def test_shared_subtree_is_not_a_cycle(self):
+        """Test that a node reachable through two parents is accepted."""
         data = {
             "root": "A",
             "nodes": {
-                "A": {"type": "min", "children": []}
+                "A": {"type": "max", "children": ["B", "C"]},
+                "B": {"type": "min", "children": ["D"]},
+                "C": {"type": "min", "children": ["D"]},
+                "D": {"type": "max", "children": ["E"]},
+                "E": {"type": "leaf", "value": 1}
             }
         }
-        with pytest.raises(jp.JSONTreeParserError):
-            jp.parse_tree_from_dict(data)
+        root = jp.parse_tree_from_dict(data)
+        assert root.children[0].children[0] is root.children[1].children[0]
     
     def test_negative_leaf_values(self):
         """Test parsing tree with negative leaf values."""
@@ -425,6 +445,34 @@ class TestParseTreeFromJsonString:
         })
         root = jp.parse_tree_from_json_string(json_str)
         assert root.name == "A"
+
+    def test_valid_json_bytes(self):
+        """Test parsing valid JSON passed as UTF-8 bytes."""
+        json_bytes = json.dumps({
+            "root": "A",
+            "nodes": {
+                "A": {"type": "max", "children": ["B"]},
+                "B": {"type": "leaf", "value": 5}
+            }
+        }).encode("utf-8")
+        root = jp.parse_tree_from_json_string(json_bytes)
+        assert root.name == "A"
+        assert root.children[0].value == 5
+
+    def test_infinity_and_nan_leaf_values(self):
+        """Test that the stdlib's NaN/Infinity literals parse with every backend."""
+        json_str = (
+            '{"root": "A", "nodes": {'
+            '"A": {"type": "max", "children": ["B", "C", "D"]},'
+            '"B": {"type": "leaf", "value": Infinity},'
+            '"C": {"type": "leaf", "value": -Infinity},'
+            '"D": {"type": "leaf", "value": NaN}}}'
+        )
+        for text in (json_str, json_str.encode("utf-8")):
+            b, c, d = jp.parse_tree_from_json_string(text).children
+            assert b.value == math.inf
+            assert c.value == -math.inf
+            assert math.isnan(d.value)
     
     def test_malformed_json(self):
         """Test error handling with malformed JSON."""
@@ -443,92 +491,176 @@ class TestParseTreeFromJsonString:
             jp.parse_tree_from_json_string(json_str)
 
 
+class TestParseTreeFromJsonFile:
+    """Test suite for parse_tree_from_json_file function."""
+    
+    tree_data = {
+        "root": "A",
+        "nodes": {
+            "A": {"type": "max", "children": ["B", "C"]},
+            "B": {"type": "leaf", "value": 3},
+            "C": {"type": "leaf", "value": 7}
+        }
+    }
+    
+    def test_small_file(self, tmp_path):
+        """Test parsing a small file (read path)."""
+        tmpdir = str(tmp_path)
+        json_path = os.path.join(tmpdir, "tree.json")
+        with open(json_path, "w") as f:
+            json.dump(self.tree_data, f)
+        
+        root = jp.parse_tree_from_json_file(json_path)
+        assert root.name == "A"
+        assert [c.value for c in root.children] == [3, 7]
+    
+    def test_large_file_uses_mmap(self, monkeypatch, tmp_path):
+        """Test parsing through the memory-mapped path."""
+        monkeypatch.setattr(jp, "_MMAP_MIN_SIZE", 0)
+        tmpdir = str(tmp_path)
+        json_path = os.path.join(tmpdir, "tree.json")
+        with open(json_path, "w") as f:
+            json.dump(self.tree_data, f)
+        
+        root = jp.parse_tree_from_json_file(json_path)
+        assert root.name == "A"
+        assert [c.value for c in root.children] == [3, 7]
+    
+    @pytest.mark.parametrize("mmap_min_size", [1 << 20, 0], ids=["read", "mmap"])
+    def test_infinity_leaf_value(self, monkeypatch, tmp_path, mmap_min_size):
+        """Test that an Infinity leaf value parses on both the read and mmap paths."""
+        monkeypatch.setattr(jp, "_MMAP_MIN_SIZE", mmap_min_size)
+        json_path = os.path.join(str(tmp_path), "tree.json")
+        with open(json_path, "w") as f:
+            f.write('{"root": "A", "nodes": {"A": {"type": "min", "children": ["B"]},'
+                    ' "B": {"type": "leaf", "value": -Infinity}}}')
+        
+        root = jp.parse_tree_from_json_file(json_path)
+        assert root.children[0].value == -math.inf
+    
+    def test_missing_file(self):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            jp.parse_tree_from_json_file("/nonexistent/tree.json")
+    
+    def test_malformed_file(self, tmp_path):
+        """Test that malformed JSON raises JSONDecodeError."""
+        tmpdir = str(tmp_path)
+        json_path = os.path.join(tmpdir, "bad.json")
+        with open(json_path, "w") as f:
+            f.write("{ invalid json }")
+        
+        with pytest.raises(json.JSONDecodeError):
+            jp.parse_tree_from_json_file(json_path)
+
+
+# Files created for each find_json_files scenario (one subdirectory per scenario)
+FIND_JSON_LAYOUT = {
+    "single": ["test.json"],
+    "multiple": ["test1.json", "test2.json"],
+    "nested": [os.path.join("subdir", "test.json")],
+    "mixed": ["test.json", "test.txt"],
+    "hidden": [os.path.join(".hidden", "skip.json"), "test.json"],
+    "levels": ["level1.json", os.path.join("sub1", "level2.json"), os.path.join("sub1", "sub2", "level3.json")],
+    "empty": [],
+}
+
+
+@pytest.fixture(scope="class")
+def json_tree(tmp_path_factory):
+    """Build all find_json_files scenarios once and share them across the class."""
+    tmpdir = str(tmp_path_factory.mktemp("find_json"))
+    for scenario, files in FIND_JSON_LAYOUT.items():
+        scenario_dir = os.path.join(tmpdir, scenario)
+        os.makedirs(scenario_dir)
+        for rel_path in files:
+            path = os.path.join(scenario_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("{}" if path.endswith(".json") else "not json")
+    return tmpdir
+
+
 class TestFindJsonFiles:
     """Test suite for find_json_files function."""
     
-    def test_find_single_json_file(self):
+    def test_find_single_json_file(self, json_tree):
         """Test finding a single JSON file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_path = os.path.join(tmpdir, "test.json")
-            with open(json_path, "w") as f:
-                f.write("{}")
-            
-            found = jp.find_json_files(tmpdir)
-            assert len(found) == 1
-            assert json_path in found
-    
-    def test_find_multiple_json_files(self):
+        tmpdir = os.path.join(json_tree, "single")
+        json_path = os.path.join(tmpdir, "test.json")
+        
+        found = jp.find_json_files(tmpdir)
+        assert len(found) == 1
+        assert json_path in found
+    
+    def test_find_multiple_json_files(self, json_tree):
         """Test finding multiple JSON files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create multiple JSON files
-            json1 = os.path.join(tmpdir, "test1.json")
-            json2 = os.path.join(tmpdir, "test2.json")
-            
-            with open(json1, "w") as f:
-                f.write("{}")
-            with open(json2, "w") as f:
-                f.write("{}")
-            
-            found = jp.find_json_files(tmpdir)
-            assert len(found) == 2
-    
-    def test_find_json_in_subdirectories(self):
+        found = jp.find_json_files(os.path.join(json_tree, "multiple"))
+        assert len(found) == 2
+    
+    def test_find_json_in_subdirectories(self, json_tree):
         """Test recursive search in subdirectories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            subdir = os.path.join(tmpdir, "subdir")
-            os.makedirs(subdir)
-            
-            json_path = os.path.join(subdir, "test.json")
-            with open(json_path, "w") as f:
-                f.write("{}")
-            
-            found = jp.find_json_files(tmpdir)
-            assert len(found) == 1
-            assert json_path in found
-    
-    def test_find_json_ignores_non_json_files(self):
+        tmpdir = os.path.join(json_tree, "nested")
+        json_path = os.path.join(tmpdir, "subdir", "test.json")
+        
+        found = jp.find_json_files(tmpdir)
+        assert len(found) == 1
+        assert json_path in found
+    
+    def test_find_json_ignores_non_json_files(self, json_tree):
         """Test that non-JSON files are ignored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create JSON and non-JSON files
-            json_file = os.path.join(tmpdir, "test.json")
-            txt_file = os.path.join(tmpdir, "test.txt")
-            
-            with open(json_file, "w") as f:
-                f.write("{}")
-            with open(txt_file, "w") as f:
-                f.write("not json")
-            
-            found = jp.find_json_files(tmpdir)
-            assert len(found) == 1
-            assert json_file in found
-            assert txt_file not in found
-    
-    def test_no_json_files_raises_error(self):
+        tmpdir = os.path.join(json_tree, "mixed")
+        json_file = os.path.join(tmpdir, "test.json")
+        txt_file = os.path.join(tmpdir, "test.txt")
+        
+        found = jp.find_json_files(tmpdir)
+        assert len(found) == 1
+        assert json_file in found
+        assert txt_file not in found
+    
+    def test_find_json_skips_hidden_directories(self, json_tree):
+        """Test that hidden directories (e.g. .git) are not searched."""
+        tmpdir = os.path.join(json_tree, "hidden")
+        json_path = os.path.join(tmpdir, "test.json")
+        
+        found = jp.find_json_files(tmpdir)
+        assert found == [json_path]
+    
+    def test_no_json_files_raises_error(self, json_tree):
         """Test error when no JSON files are found."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(FileNotFoundError):
-                jp.find_json_files(tmpdir)
+        with pytest.raises(FileNotFoundError):
+            jp.find_json_files(os.path.join(json_tree, "empty"))
     
-    def test_finds_json_with_different_nesting_levels(self):
+    def test_finds_json_with_different_nesting_levels(self, json_tree):
         """Test finding JSON files at different nesting levels."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create files at different depths
-            json1 = os.path.join(tmpdir, "level1.json")
-            subdir1 = os.path.join(tmpdir, "sub1")
-            subdir2 = os.path.join(subdir1, "sub2")
-            os.makedirs(subdir2)
-            json2 = os.path.join(subdir1, "level2.json")
-            json3 = os.path.join(subdir2, "level3.json")
-            
-            with open(json1, "w") as f:
-                f.write("{}")
-            with open(json2, "w") as f:
-                f.write("{}")
-            with open(json3, "w") as f:
-                f.write("{}")
-            
-            found = jp.find_json_files(tmpdir)
-            assert len(found) == 3
+        found = jp.find_json_files(os.path.join(json_tree, "levels"))
+        assert len(found) == 3
+    
+    def test_unreadable_subdirectory_is_skipped(self, json_tree, monkeypatch):
+        """Test that a subdirectory which can't be listed is skipped, not raised."""
+        tmpdir = os.path.join(json_tree, "levels")
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if path != tmpdir:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        
+        monkeypatch.setattr(jp.os, "scandir", scandir)
+        found = jp.find_json_files(tmpdir)
+        assert found == [os.path.join(tmpdir, "level1.json")]
+    
+    def test_missing_start_directory_raises_no_json_error(self, json_tree):
+        """Test that a missing start directory reports no JSON files found."""
+        missing = os.path.join(json_tree, "does_not_exist")
+        with pytest.raises(FileNotFoundError, match="No JSON files found in directory"):
+            jp.find_json_files(missing)
+    
+    def test_file_as_start_directory_raises_no_json_error(self, json_tree):
+        """Test that a non-directory start path reports no JSON files found."""
+        json_path = os.path.join(json_tree, "single", "test.json")
+        with pytest.raises(FileNotFoundError, match="No JSON files found in directory"):
+            jp.find_json_files(json_path)
 
 
 class TestRaiseNoJsonFilesFound:
@@ -563,31 +695,27 @@ class TestJSONTreeParserError:
 class TestIntegration:
     """Integration tests for the whole parsing pipeline."""
     
-    def test_parse_from_file(self):
+    def test_parse_from_file(self, tmp_path):
         """Test parsing a complete JSON tree from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tree_data = {
-                "root": "A",
-                "nodes": {
-                    "A": {"type": "max", "children": ["B", "C"]},
-                    "B": {"type": "min", "children": ["D", "E"]},
-                    "C": {"type": "leaf", "value": 3},
-                    "D": {"type": "leaf", "value": 5},
-                    "E": {"type": "leaf", "value": -2}
-                }
+        tmpdir = str(tmp_path)
+        tree_data = {
+            "root": "A",
+            "nodes": {
+                "A": {"type": "max", "children": ["B", "C"]},
+                "B": {"type": "min", "children": ["D", "E"]},
+                "C": {"type": "leaf", "value": 3},
+                "D": {"type": "leaf", "value": 5},
+                "E": {"type": "leaf", "value": -2}
             }
-            
-            json_path = os.path.join(tmpdir, "tree.json")
-            with open(json_path, "w") as f:
-                json.dump(tree_data, f)
-            
-            # Read and parse
-            with open(json_path, "r") as f:
-                json_str = f.read()
-            
-            root = jp.parse_tree_from_json_string(json_str)
-            leaves = jp.list_leaves(root)
-            
-            assert root.name == "A"
-            assert len(leaves) == 3
-            assert {l.value for l in leaves} == {3, 5, -2}
+        }
+        
+        json_path = os.path.join(tmpdir, "tree.json")
+        with open(json_path, "w") as f:
+            json.dump(tree_data, f)
+        
+        root = jp.parse_tree_from_json_file(json_path)
+        leaves = jp.list_leaves(root)
+        
+        assert root.name == "A"
+        assert len(leaves) == 3
+        assert {l.value for l in leaves} == {3, 5, -2}
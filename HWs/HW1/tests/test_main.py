@@ -12,11 +12,8 @@ import pytest
 import json
 import tempfile
 import os
-import sys
-from io import StringIO
 from unittest.mock import patch, MagicMock, mock_open, call
 
-sys.path.insert(0, "../src")
 import main
 import json_parser as jp
 import utils as utils
@@ -25,7 +22,7 @@ import utils as utils
 class TestTempRefactor:
     """Test suite for run_miniMax function."""
     
-    def test_valid_json_file(self):
+    def test_valid_json_file(self, capsys):
         """Test processing a valid JSON file."""
         tree_data = {
             "root": "A",
@@ -41,19 +38,16 @@ class TestTempRefactor:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             assert "A" in output
             assert "B" in output or "3" in output
         finally:
             os.unlink(temp_path)
     
     
-    def test_output_includes_tree_info(self):
+    def test_output_includes_tree_info(self, capsys):
         """Test that output includes tree information."""
         tree_data = {
             "root": "A",
@@ -68,18 +62,15 @@ class TestTempRefactor:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should include demo messages and tree info
             assert "demo" in output or "Root" in output or "A" in output
         finally:
             os.unlink(temp_path)
     
-    def test_leaves_extraction(self):
+    def test_leaves_extraction(self, capsys):
         """Test that leaves are correctly extracted and displayed."""
         tree_data = {
             "root": "A",
@@ -95,18 +86,15 @@ class TestTempRefactor:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should display leaf information
             assert "Leaves" in output or "B" in output or "C" in output
         finally:
             os.unlink(temp_path)
     
-    def test_complex_tree_processing(self):
+    def test_complex_tree_processing(self, capsys):
         """Test processing a more complex tree structure."""
         tree_data = {
             "root": "A",
@@ -124,12 +112,9 @@ class TestTempRefactor:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should process without errors and display info
             assert output  # Should have some output
         finally:
@@ -139,7 +124,7 @@ class TestTempRefactor:
 class TestMain:
     """Test suite for main function."""
     
-    def test_main_with_valid_file_argument(self):
+    def test_main_with_valid_file_argument(self, capsys):
         """Test main with a valid JSON file as argument."""
         tree_data = {
             "root": "A",
@@ -155,54 +140,42 @@ class TestMain:
         
         try:
             with patch("builtins.input", side_effect=["exit"]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([temp_path])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should process the argument and handle exit
                 assert output  # Should have some output
         finally:
             os.unlink(temp_path)
     
-    def test_main_with_invalid_file_argument(self):
+    def test_main_with_invalid_file_argument(self, capsys):
         """Test main with an invalid file path as argument."""
         with patch("builtins.input", side_effect=["exit"]):
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.main(["/nonexistent/path.json"])
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should indicate invalid path
             assert "valid" in output.lower() or "error" in output.lower() or "not found" in output.lower()
     
-    def test_main_exit_command_case_insensitive(self):
+    def test_main_exit_command_case_insensitive(self, capsys):
         """Test that exit command is case-insensitive."""
         with patch("builtins.input", side_effect=["EXIT"]):
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.main([])
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should successfully exit
             assert "THANK YOU" in output or "exit" in output.lower()
     
-    def test_main_quit_command(self):
+    def test_main_quit_command(self, capsys):
         """Test that quit command works like exit."""
         with patch("builtins.input", side_effect=["QUIT"]):
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.main([])
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should successfully quit
             assert "THANK YOU" in output or "quit" in output.lower()
     
-    def test_main_relative_path_conversion(self):
+    def test_main_relative_path_conversion(self, capsys):
         """Test that relative paths are converted to absolute."""
         tree_data = {
             "root": "A",
@@ -218,19 +191,16 @@ class TestMain:
         
         try:
             with patch("builtins.input", side_effect=["exit"]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([temp_name])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should process relative path correctly
                 assert output
         finally:
             os.unlink(temp_name)
     
     @patch("json_parser.find_json_files")
-    def test_main_find_recursive_json_files_yes(self, mock_find):
+    def test_main_find_recursive_json_files_yes(self, mock_find, capsys):
         """Test recursive JSON file discovery when user answers yes."""
         tree_data = {
             "root": "A",
@@ -253,12 +223,9 @@ class TestMain:
                 "y",
                 "exit"
             ]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should call find_json_files
                 assert mock_find.called
         finally:
@@ -272,31 +239,25 @@ class TestMain:
             "n",
             "exit"
         ]):
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.main([])
-            sys.stdout = sys.__stdout__
             
             # Should not call find_json_files
             assert not mock_find.called
     
-    def test_main_multiple_invalid_paths(self):
+    def test_main_multiple_invalid_paths(self, capsys):
         """Test main handling multiple invalid paths before exit."""
         with patch("builtins.input", side_effect=[
             "/invalid/path1.json",
             "/invalid/path2.json",
             "exit"
         ]):
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.main([])
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should handle multiple invalid paths
             assert output
     
-    def test_main_exit_after_argument_processing(self):
+    def test_main_exit_after_argument_processing(self, capsys):
         """Test that exit can occur after processing argument."""
         tree_data = {
             "root": "A",
@@ -312,12 +273,9 @@ class TestMain:
         
         try:
             with patch("builtins.input", side_effect=["exit"]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([temp_path])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should include thank you message on exit
                 assert "THANK YOU" in output
         finally:
@@ -327,7 +285,7 @@ class TestMain:
 class TestEdgeCases:
     """Test suite for edge cases and potential bugs."""
     
-    def test_large_json_file(self):
+    def test_large_json_file(self, capsys):
         """Test handling of large JSON tree."""
         # Create a large tree with many leaves
         nodes = {"A": {"type": "max", "children": []}}
@@ -343,17 +301,14 @@ class TestEdgeCases:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             assert "100" in output or "A" in output
         finally:
             os.unlink(temp_path)
     
-    def test_special_characters_in_node_names(self):
+    def test_special_characters_in_node_names(self, capsys):
         """Test handling of special characters in node names."""
         tree_data = {
             "root": "Node-A",
@@ -368,17 +323,14 @@ class TestEdgeCases:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             assert "Node" in output
         finally:
             os.unlink(temp_path)
     
-    def test_unicode_node_names(self):
+    def test_unicode_node_names(self, capsys):
         """Test handling of unicode characters in node names."""
         tree_data = {
             "root": "الف",  # Arabic letter
@@ -393,12 +345,9 @@ class TestEdgeCases:
             temp_path = f.name
         
         try:
-            captured_output = StringIO()
-            sys.stdout = captured_output
             main.run_miniMax(temp_path)
-            sys.stdout = sys.__stdout__
             
-            output = captured_output.getvalue()
+            output = capsys.readouterr().out
             # Should handle unicode properly
             assert output
         finally:
@@ -408,7 +357,7 @@ class TestEdgeCases:
 class TestIntegrationMain:
     """Integration tests for main module."""
     
-    def test_full_workflow_with_valid_file(self):
+    def test_full_workflow_with_valid_file(self, capsys):
         """Test complete workflow from file argument to exit."""
         tree_data = {
             "root": "A",
@@ -427,19 +376,16 @@ class TestIntegrationMain:
         
         try:
             with patch("builtins.input", side_effect=["exit"]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([temp_path])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should successfully process and exit
                 assert "THANK YOU" in output
                 assert len(output) > 0
         finally:
             os.unlink(temp_path)
     
-    def test_full_workflow_interactive(self):
+    def test_full_workflow_interactive(self, capsys):
         """Test complete interactive workflow."""
         tree_data = {
             "root": "A",
@@ -459,12 +405,9 @@ class TestIntegrationMain:
                 "n",
                 "exit"
             ]):
-                captured_output = StringIO()
-                sys.stdout = captured_output
                 main.main([])
-                sys.stdout = sys.__stdout__
                 
-                output = captured_output.getvalue()
+                output = capsys.readouterr().out
                 # Should process path and exit successfully
                 assert "THANK YOU" in output
         finally:
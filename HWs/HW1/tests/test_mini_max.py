@@ -0,0 +1,163 @@
+"""
+Test suite for mini_max module.
+
+Tests cover:
+- miniMax and alphaBeta values for leaf, max and min nodes
+- In-place assignment of values on internal nodes
+- Deep trees (no recursion limit) and invalid trees
+"""
+
+import pytest
+
+import json_parser as jp
+import mini_max
+
+
+def build_example_tree():
+    """Build the example tree from tree.json."""
+    data = {
+        "root": "A",
+        "nodes": {
+            "A": {"type": "max", "children": ["B", "C"]},
+            "B": {"type": "min", "children": ["D", "E"]},
+            "C": {"type": "leaf", "value": 3},
+            "D": {"type": "leaf", "value": 5},
+            "E": {"type": "leaf", "value": -2}
+        }
+    }
+    return jp.parse_tree_from_dict(data)
+
+
+class TestMiniMax:
+    """Test suite for miniMax function."""
+
+    def test_single_leaf(self):
+        """Test that a leaf returns its own value."""
+        node = jp.Node(name="A", type="leaf", value=7)
+        assert mini_max.miniMax(node) == 7
+
+    def test_max_node(self):
+        """Test that a max node takes the largest child value."""
+        root = jp.Node(name="A", type="max", children=[
+            jp.Node(name="B", type="leaf", value=3),
+            jp.Node(name="C", type="leaf", value=7)
+        ])
+        assert mini_max.miniMax(root) == 7
+        assert root.value == 7
+
+    def test_min_node(self):
+        """Test that a min node takes the smallest child value."""
+        root = jp.Node(name="A", type="min", children=[
+            jp.Node(name="B", type="leaf", value=3),
+            jp.Node(name="C", type="leaf", value=7)
+        ])
+        assert mini_max.miniMax(root) == 3
+        assert root.value == 3
+
+    def test_reassigned_type_is_honoured(self):
+        """Test that changing a node's type after creation changes the result."""
+        root = jp.Node(name="A", type="max", children=[
+            jp.Node(name="B", type="leaf", value=1),
+            jp.Node(name="C", type="leaf", value=5)
+        ])
+        root.type = "min"
+        assert mini_max.miniMax(root) == 1
+    
+    def test_example_tree(self):
+        """Test the example tree and the values stored on internal nodes."""
+        root = build_example_tree()
+        assert mini_max.miniMax(root) == 3
+        assert root.value == 3
+        assert root.children[0].value == -2
+
+    def test_unknown_node_type(self):
+        """Test that an unknown node type raises ValueError."""
+        root = jp.Node(name="A", type="avg", children=[
+            jp.Node(name="B", type="leaf", value=1)
+        ])
+        with pytest.raises(ValueError):
+            mini_max.miniMax(root)
+
+
+class TestAlphaBeta:
+    """Test suite for alphaBeta function."""
+
+    def test_single_leaf(self):
+        """Test that a leaf returns its own value."""
+        node = jp.Node(name="A", type="leaf", value=7)
+        assert mini_max.alphaBeta(node) == 7
+
+    def test_example_tree(self):
+        """Test that the example tree gives the same value as miniMax."""
+        root = build_example_tree()
+        assert mini_max.alphaBeta(root) == 3
+        assert root.value == 3
+
+    def test_matches_minimax(self):
+        """Test alphaBeta against miniMax on a 3-level tree."""
+        def build():
+            return jp.Node(name="A", type="max", children=[
+                jp.Node(name="B", type="min", children=[
+                    jp.Node(name="D", type="max", children=[
+                        jp.Node(name="H", type="leaf", value=3),
+                        jp.Node(name="I", type="leaf", value=12)
+                    ]),
+                    jp.Node(name="E", type="leaf", value=8)
+                ]),
+                jp.Node(name="C", type="min", children=[
+                    jp.Node(name="F", type="leaf", value=2),
+                    jp.Node(name="G", type="max", children=[
+                        jp.Node(name="J", type="leaf", value=4),
+                        jp.Node(name="K", type="leaf", value=6)
+                    ])
+                ])
+            ])
+        assert mini_max.alphaBeta(build()) == mini_max.miniMax(build()) == 8
+
+    def test_pruned_subtree_is_not_visited(self):
+        """Test that a subtree which cannot change the result is skipped."""
+        # After B = 3, C's first child (2) already makes C <= 2 < 3,
+        # so the invalid node X must never be evaluated.
+        invalid = jp.Node(name="X", type="avg", children=[
+            jp.Node(name="Y", type="leaf", value=100)
+        ])
+        root = jp.Node(name="A", type="max", children=[
+            jp.Node(name="B", type="min", children=[
+                jp.Node(name="D", type="leaf", value=3),
+                jp.Node(name="E", type="leaf", value=5)
+            ]),
+            jp.Node(name="C", type="min", children=[
+                jp.Node(name="F", type="leaf", value=2),
+                invalid
+            ])
+        ])
+        assert mini_max.alphaBeta(root) == 3
+
+
+@pytest.mark.parametrize("search", [mini_max.miniMax, mini_max.alphaBeta], ids=["miniMax", "alphaBeta"])
+class TestSearchCommon:
+    """Tests shared by miniMax and alphaBeta."""
+
+    def test_deep_tree_no_recursion_error(self, search, deep_chain):
+        """Test a chain deeper than the default recursion limit."""
+        node, _ = deep_chain
+        assert search(node) == 1
+
+    def test_cycle_raises(self, search):
+        """Test that a cyclic graph raises instead of looping forever."""
+        a = jp.Node(name="A", type="max")
+        b = jp.Node(name="B", type="min", children=[a])
+        a.children.append(b)
+        with pytest.raises(ValueError):
+            search(a)
+
+    def test_cycle_below_deep_chain_raises(self, search):
+        """Test that a cycle first reached past the initial check depth is still caught."""
+        a = jp.Node(name="A", type="max")
+        b = jp.Node(name="B", type="min", children=[a])
+        a.children.append(b)
+        node = a
+        for i in range(3000):
+            node = jp.Node(name=f"N{i}", type="max", children=[node])
+        with pytest.raises(ValueError):
+            search(node)
@@ -14,11 +14,20 @@ import tempfile
 import sys
 from io import StringIO
 
-sys.path.insert(0, "../src")
 import utils 
 import json_parser as jp
 
 
+class WriteRecorder:
+    """Text stream stand-in that records every write call."""
+    
+    def __init__(self):
+        self.writes = []
+    
+    def write(self, text):
+        self.writes.append(text)
+
+
 class TestIsPathValid:
     """Test suite for is_path_valid function."""
     
@@ -32,10 +41,9 @@ class TestIsPathValid:
         finally:
             os.unlink(temp_path)
     
-    def test_existing_directory_is_valid(self):
+    def test_existing_directory_is_valid(self, tmp_path):
         """Test that an existing directory is considered valid."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            assert utils.is_path_valid(tmpdir) is True
+        assert utils.is_path_valid(str(tmp_path)) is True
     
     def test_nonexistent_file_is_invalid(self):
         """Test that a non-existent file is invalid."""
@@ -64,6 +72,30 @@ class TestIsPathValid:
             assert utils.is_path_valid(temp_name) is True
         finally:
             os.unlink(temp_name)
+    
+    def test_result_is_cached_within_ttl(self, monkeypatch):
+        """Test that a repeated check within the TTL reuses the cached result."""
+        # Never expire, so the result doesn't depend on how fast the box runs
+        monkeypatch.setattr(utils, "_EXIST_TTL", float("inf"))
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            temp_path = f.name
+        
+        assert utils.is_path_valid(temp_path) is True
+        os.unlink(temp_path)
+        # Still cached as existing until the cache is cleared
+        assert utils.is_path_valid(temp_path) is True
+        utils.is_path_valid.cache_clear()
+        assert utils.is_path_valid(temp_path) is False
+    
+    def test_result_expires_after_ttl(self, monkeypatch):
+        """Test that cached results are refreshed once the TTL has passed."""
+        monkeypatch.setattr(utils, "_EXIST_TTL", 0.0)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            temp_path = f.name
+        
+        assert utils.is_path_valid(temp_path) is True
+        os.unlink(temp_path)
+        assert utils.is_path_valid(temp_path) is False
 
 
 class TestResolvePathRelativeToPythonScript:
@@ -158,6 +190,12 @@ class TestIsExitCommand:
         assert utils.is_exit_command("exiting") is False
         assert utils.is_exit_command("quitting") is False
     
+    def test_uppercase_partial_match_not_recognized(self):
+        """Test that uppercase partial matches are not recognized."""
+        assert utils.is_exit_command("EX") is False
+        assert utils.is_exit_command("EXITING") is False
+        assert utils.is_exit_command("QUITTING") is False
+    
     def test_empty_string(self):
         """Test empty string is not an exit command."""
         assert utils.is_exit_command("") is False
@@ -166,6 +204,10 @@ class TestIsExitCommand:
         """Test whitespace-only string is not an exit command."""
         assert utils.is_exit_command("   ") is False
     
+    def test_none_is_not_exit_command(self):
+        """Test that None is not recognized as exit command."""
+        assert utils.is_exit_command(None) is False
+    
     def test_numeric_input(self):
         """Test numeric input is not recognized as exit command."""
         assert utils.is_exit_command("0") is False
@@ -175,32 +217,26 @@ class TestIsExitCommand:
 class TestPrettyPrint:
     """Test suite for pretty_print function."""
     
-    def test_single_leaf_print(self):
+    def test_single_leaf_print(self, capsys):
         """Test printing a single leaf node."""
         node = jp.Node(name="A", type="leaf", value=5)
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(node)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "A" in output
         assert "leaf" in output
         assert "5" in output
     
-    def test_simple_tree_print(self):
+    def test_simple_tree_print(self, capsys):
         """Test printing a simple tree."""
         leaf1 = jp.Node(name="B", type="leaf", value=3)
         leaf2 = jp.Node(name="C", type="leaf", value=7)
         root = jp.Node(name="A", type="max", children=[leaf1, leaf2])
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(root)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "A" in output
         assert "max" in output
         assert "B" in output
@@ -208,7 +244,7 @@ class TestPrettyPrint:
         assert "3" in output
         assert "7" in output
     
-    def test_nested_tree_print(self):
+    def test_nested_tree_print(self, capsys):
         """Test printing a nested tree with indentation."""
         leaf1 = jp.Node(name="D", type="leaf", value=5)
         leaf2 = jp.Node(name="E", type="leaf", value=-2)
@@ -216,12 +252,9 @@ class TestPrettyPrint:
         leaf3 = jp.Node(name="C", type="leaf", value=3)
         root = jp.Node(name="A", type="max", children=[node_b, leaf3])
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(root)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         lines = output.strip().split("\n")
         
         # Check that indentation increases for nested nodes
@@ -230,50 +263,41 @@ class TestPrettyPrint:
         assert "B" in output
         assert "D" in output
     
-    def test_print_with_custom_indent(self):
+    def test_print_with_custom_indent(self, capsys):
         """Test pretty_print with custom initial indentation."""
         node = jp.Node(name="A", type="leaf", value=5)
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(node, indent=2)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         # Should have indentation
         assert output.startswith("    -")  # 2 indents * 2 spaces + "- "
     
-    def test_print_max_node(self):
+    def test_print_max_node(self, capsys):
         """Test printing max node is labeled correctly."""
         node = jp.Node(name="MAX_NODE", type="max", children=[
             jp.Node(name="child", type="leaf", value=1)
         ])
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(node)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "max" in output
         assert "MAX_NODE" in output
     
-    def test_print_min_node(self):
+    def test_print_min_node(self, capsys):
         """Test printing min node is labeled correctly."""
         node = jp.Node(name="MIN_NODE", type="min", children=[
             jp.Node(name="child", type="leaf", value=1)
         ])
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(node)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "min" in output
         assert "MIN_NODE" in output
     
-    def test_print_deep_tree(self):
+    def test_print_deep_tree(self, capsys):
         """Test printing a deeply nested tree."""
         # Create a deep tree: A -> B -> C -> D (leaf)
         leaf = jp.Node(name="D", type="leaf", value=10)
@@ -281,44 +305,176 @@ class TestPrettyPrint:
         node_b = jp.Node(name="B", type="max", children=[node_c])
         root = jp.Node(name="A", type="max", children=[node_b])
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(root)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "A" in output
         assert "B" in output
         assert "C" in output
         assert "D" in output
         assert "10" in output
     
-    def test_print_negative_values(self):
+    def test_print_order_and_indentation(self, capsys):
+        """Test that nodes are printed in DFS order with one indent per level."""
+        leaf1 = jp.Node(name="D", type="leaf", value=5)
+        leaf2 = jp.Node(name="E", type="leaf", value=-2)
+        node_b = jp.Node(name="B", type="min", children=[leaf1, leaf2])
+        leaf3 = jp.Node(name="C", type="leaf", value=3)
+        root = jp.Node(name="A", type="max", children=[node_b, leaf3])
+        
+        utils.pretty_print(root)
+        
+        assert capsys.readouterr().out.split("\n") == [
+            "- A (max)",
+            "  - B (min)",
+            "    - D (leaf) value=5.0",
+            "    - E (leaf) value=-2.0",
+            "  - C (leaf) value=3.0",
+            "",
+        ]
+    
+    def test_print_tree_deeper_than_recursion_limit(self, capsys, deep_chain):
+        """Test printing a chain deeper than the recursion limit."""
+        node, depth = deep_chain
+        utils.pretty_print(node)
+        
+        lines = capsys.readouterr().out.strip("\n").split("\n")
+        assert len(lines) == depth + 1
+        assert lines[-1] == "  " * depth + "- leaf (leaf) value=1.0"
+    
+    def test_print_uses_current_node_type(self, capsys):
+        """Test that a node whose type was reassigned prints with its new type."""
+        node = jp.Node(name="A", type="leaf", value=1)
+        node.type = "max"
+        utils.pretty_print(node)
+        assert capsys.readouterr().out == "- A (max) value=1.0\n"
+    
+    def test_print_negative_values(self, capsys):
         """Test printing nodes with negative values."""
         node = jp.Node(name="A", type="leaf", value=-42)
         
-        captured_output = StringIO()
-        sys.stdout = captured_output
         utils.pretty_print(node)
-        sys.stdout = sys.__stdout__
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "-42" in output
 
 
+class TestPrettyPrintStream:
+    """Test suite for pretty_print_stream function."""
+    
+    def test_writes_to_given_stream(self, capsys):
+        """Test that output goes to the given stream, not stdout."""
+        root = jp.Node(name="A", type="max", children=[
+            jp.Node(name="B", type="leaf", value=3)
+        ])
+        stream = StringIO()
+        
+        utils.pretty_print_stream(root, stream)
+        
+        assert capsys.readouterr().out == ""
+        assert stream.getvalue() == "- A (max)\n  - B (leaf) value=3.0\n"
+    
+    def test_single_write_call(self):
+        """Test that the whole tree is emitted with one write call."""
+        root = jp.Node(name="A", type="max", children=[
+            jp.Node(name="B", type="leaf", value=3),
+            jp.Node(name="C", type="leaf", value=7)
+        ])
+        stream = WriteRecorder()
+        utils.pretty_print_stream(root, stream)
+        assert len(stream.writes) == 1
+    
+    def test_custom_indent(self):
+        """Test that the indent argument shifts every line."""
+        node = jp.Node(name="A", type="leaf", value=5)
+        stream = StringIO()
+        utils.pretty_print_stream(node, stream, indent=1)
+        assert stream.getvalue() == "  - A (leaf) value=5.0\n"
+
+
+class TestPrettyPrintMany:
+    """Test suite for pretty_print_many function."""
+    
+    def test_matches_separate_prints(self):
+        """Test that the output equals printing each tree on its own."""
+        roots = [
+            jp.Node(name="A", type="max", children=[
+                jp.Node(name="B", type="leaf", value=3),
+                jp.Node(name="C", type="leaf", value=7)
+            ]),
+            jp.Node(name="D", type="leaf", value=-1)
+        ]
+        expected = StringIO()
+        for root in roots:
+            utils.pretty_print_stream(root, expected)
+        
+        stream = StringIO()
+        utils.pretty_print_many(roots, stream)
+        assert stream.getvalue() == expected.getvalue()
+    
+    def test_single_write_call(self):
+        """Test that all trees are emitted with one write call."""
+        roots = [jp.Node(name=n, type="leaf", value=1) for n in "ABC"]
+        stream = WriteRecorder()
+        utils.pretty_print_many(iter(roots), stream)
+        assert stream.writes == ["- A (leaf) value=1.0\n- B (leaf) value=1.0\n- C (leaf) value=1.0\n"]
+    
+    def test_no_roots_writes_nothing(self):
+        """Test that an empty iterable produces no output."""
+        stream = StringIO()
+        utils.pretty_print_many([], stream)
+        assert stream.getvalue() == ""
+
+
+class TestCanonicalizeAndCheck:
+    """Test suite for canonicalize_and_check function."""
+    
+    def test_existing_absolute_path(self, tmp_path):
+        """Test that an existing absolute path is returned unchanged and valid."""
+        test_file = os.path.join(str(tmp_path), "tree.json")
+        with open(test_file, "w") as f:
+            f.write("{}")
+        assert utils.canonicalize_and_check(test_file) == (test_file, True)
+    
+    def test_nonexistent_path(self):
+        """Test that a missing path is reported as invalid."""
+        path, valid = utils.canonicalize_and_check("/nonexistent/path/tree.json")
+        assert path == "/nonexistent/path/tree.json"
+        assert valid is False
+    
+    def test_relative_path_under_project_root(self):
+        """Test that a relative path found under the project root comes back normalized and valid."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        expected = os.path.join(project_root, "tree.json")
+        assert utils.canonicalize_and_check(os.path.join(".", "tree.json")) == (expected, True)
+    
+    def test_found_relative_path_is_not_checked_again(self, monkeypatch):
+        """Test that a relative path found by the lookup skips the second existence check."""
+        def fail(path):
+            pytest.fail(f"is_path_valid called again for {path}")
+        monkeypatch.setattr(utils, "is_path_valid", fail)
+        path, valid = utils.canonicalize_and_check("tree.json")
+        assert valid is True
+        assert os.path.isabs(path)
+    
+    def test_missing_relative_path_is_kept_as_given(self):
+        """Test that a relative path found under neither root is returned unchanged and invalid."""
+        assert utils.canonicalize_and_check("no_such_tree.json") == ("no_such_tree.json", False)
+
+
 class TestIntegrationUtils:
     """Integration tests for utils module functions."""
     
-    def test_path_workflow(self):
+    def test_path_workflow(self, tmp_path):
         """Test complete path resolution workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a test file
-            test_file = os.path.join(tmpdir, "test.json")
-            with open(test_file, "w") as f:
-                f.write("{}")
-            
-            # Test that it can be found
-            assert utils.is_path_valid(test_file) is True
+        tmpdir = str(tmp_path)
+        # Create a test file
+        test_file = os.path.join(tmpdir, "test.json")
+        with open(test_file, "w") as f:
+            f.write("{}")
+        
+        # Test that it can be found
+        assert utils.is_path_valid(test_file) is True
     
     def test_exit_command_workflow(self):
         """Test exit command in various scenarios."""